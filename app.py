@@ -1,20 +1,42 @@
 from flask import Flask, redirect, render_template, request, jsonify
+from flask.json.provider import JSONProvider
+from flask_compress import Compress
 from flask_cors import CORS
 import os
 import requests
-import json
-import time
+import orjson
+import queue
 import sqlite3
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from datetime import datetime, timezone
+from functools import lru_cache
+from hashlib import md5
+from cachetools import TTLCache
 from dotenv import load_dotenv
-from playwright.sync_api import sync_playwright
+from requests.adapters import HTTPAdapter
+from requests.cookies import create_cookie
+from playwright.sync_api import sync_playwright, TimeoutError as PlaywrightTimeoutError
 from linkedin_api import Linkedin
 from apscheduler.schedulers.background import BackgroundScheduler
 
 load_dotenv()
 
+class ORJSONProvider(JSONProvider):
+    """Flask JSON provider backed by orjson: faster encode/decode for
+    every request.get_json()/jsonify in the app."""
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
 app = Flask(__name__)
+app.json = ORJSONProvider(app)
 CORS(app)  # Enable CORS for extension requests
+Compress(app)  # gzip responses (the callback page and JSON shrink ~5x on wire)
 
 # Stored in Render Environment Variables
 CLIENT_ID = os.getenv("LINKEDIN_CLIENT_ID")
@@ -26,16 +48,43 @@ SCOPE = "openid profile email"
 
 DB_PATH = os.getenv("SCHEDULE_DB_PATH", "schedule.db")
 
+# Shared session for the OAuth token exchange: keeps pooled HTTPS
+# connections to linkedin.com warm instead of handshaking per callback.
+_oauth_session = requests.Session()
+_oauth_session.mount("https://", HTTPAdapter(pool_connections=8, pool_maxsize=64))
+
+
+class _Connection(sqlite3.Connection):
+    """sqlite3.Connection that runs PRAGMA optimize before closing."""
+
+    def close(self):
+        try:
+            self.execute("PRAGMA optimize;")
+        except sqlite3.Error:
+            pass
+        super().close()
+
 
 def db_connect():
-    conn = sqlite3.connect(DB_PATH, check_same_thread=False)
+    conn = sqlite3.connect(DB_PATH, check_same_thread=False, factory=_Connection)
     conn.row_factory = sqlite3.Row
+    # Per-connection tuning: don't fsync on every commit (WAL makes NORMAL safe),
+    # keep temp tables in RAM, use a ~20MB page cache, and wait instead of
+    # failing with SQLITE_BUSY when the scheduler and a request handler collide.
+    conn.execute("PRAGMA synchronous=NORMAL;")
+    conn.execute("PRAGMA temp_store=MEMORY;")
+    conn.execute("PRAGMA cache_size=-20000;")
+    conn.execute("PRAGMA busy_timeout=5000;")
     return conn
 
 
 def init_db():
     conn = db_connect()
     try:
+        # WAL lets the scheduler's reads proceed concurrently with
+        # /schedule-post inserts. The mode is persistent, so setting it
+        # once at startup covers every later connection.
+        conn.execute("PRAGMA journal_mode=WAL;")
         conn.execute(
             """
             CREATE TABLE IF NOT EXISTS scheduled_posts (
@@ -49,7 +98,11 @@ def init_db():
             );
             """
         )
-        conn.execute("CREATE INDEX IF NOT EXISTS idx_scheduled_posts_run ON scheduled_posts(status, run_at);")
+        # Partial index over only the pending rows: the scheduler's claim
+        # query walks it in run_at order without touching done/failed rows,
+        # and it stays tiny no matter how much history accumulates.
+        conn.execute("DROP INDEX IF EXISTS idx_scheduled_posts_run;")
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_pending_run ON scheduled_posts(run_at) WHERE status = 'pending';")
         conn.commit()
     finally:
         conn.close()
@@ -76,66 +129,236 @@ def post_to_linkedin_with_cookies(cookies: dict, text: str):
     return api.create_post(text=text)
 
 
+# Hot-path SQL, defined once so the statement text is shared (and interned)
+# across scheduler cycles instead of rebuilt per call.
+SQL_CLAIM_BATCH = """
+    UPDATE scheduled_posts
+    SET status = 'processing'
+    WHERE id IN (
+        SELECT id FROM scheduled_posts
+        WHERE status = 'pending' AND run_at <= ?
+        ORDER BY run_at ASC
+        LIMIT 25
+    )
+    RETURNING id, text, cookies_json
+"""
+SQL_MARK_DONE = "UPDATE scheduled_posts SET status = 'done', last_error = NULL WHERE id = ?"
+SQL_MARK_FAILED = "UPDATE scheduled_posts SET status = 'failed', last_error = ? WHERE id = ?"
+SQL_INSERT_POST = """
+    INSERT INTO scheduled_posts(created_at, run_at, status, text, cookies_json, last_error)
+    VALUES(?, ?, 'pending', ?, ?, NULL)
+"""
+
+
+# All writes funnel through a single background thread, so Flask handler
+# threads and the scheduler never fight over SQLite's write lock, and
+# bursts of writes coalesce into one transaction.
+_write_queue = queue.Queue()
+
+
+def _enqueue_write(sql, params=(), many=False):
+    """
+    Hand a write to the writer thread. Returns a Future resolving to the
+    statement's lastrowid once the batch it joined has committed.
+    """
+    future = Future()
+    _write_queue.put((future, sql, params, many))
+    return future
+
+
+def _writer_loop():
+    # The connection is (re)opened inside the loop: if it dies once, the
+    # thread must not — a dead writer would leave every later
+    # _enqueue_write(...).result() blocked forever, wedging the Flask
+    # handlers. Any failure fails the batch's futures and the next batch
+    # reconnects.
+    conn = None
+    while True:
+        batch = [_write_queue.get()]
+        while len(batch) < 32:
+            try:
+                batch.append(_write_queue.get_nowait())
+            except queue.Empty:
+                break
+
+        outcomes = []
+        try:
+            if conn is None:
+                conn = db_connect()
+            conn.execute("BEGIN IMMEDIATE")
+            for future, sql, params, many in batch:
+                try:
+                    cur = conn.executemany(sql, params) if many else conn.execute(sql, params)
+                    outcomes.append((future, cur.lastrowid, None))
+                except Exception as e:
+                    outcomes.append((future, None, e))
+            conn.commit()
+        except Exception as e:
+            try:
+                if conn is not None:
+                    conn.rollback()
+            except Exception:
+                # Connection is beyond recovery; drop it and reconnect
+                # for the next batch.
+                try:
+                    conn.close()
+                except Exception:
+                    pass
+                conn = None
+            for future, _sql, _params, _many in batch:
+                if not future.done():
+                    future.set_exception(e)
+            continue
+
+        for future, lastrowid, error in outcomes:
+            if error is not None:
+                future.set_exception(error)
+            else:
+                future.set_result(lastrowid)
+
+
+# Adaptive polling: run every POLL_INTERVAL_SECONDS while there is work,
+# back off exponentially (capped) while the queue stays empty.
+POLL_INTERVAL_SECONDS = 30
+MAX_POLL_INTERVAL_SECONDS = 300
+
+_empty_polls = 0
+_poll_seconds = POLL_INTERVAL_SECONDS
+
+
+def _set_poll_interval(seconds):
+    global _poll_seconds
+    if seconds == _poll_seconds:
+        return
+    _poll_seconds = seconds
+    try:
+        scheduler.reschedule_job("process_due_posts", trigger="interval", seconds=seconds)
+    except Exception:
+        pass  # scheduler not started yet or shutting down
+
+
 def process_due_posts():
     """
     Runs on the server. Picks due scheduled posts and posts them to LinkedIn.
     Uses a DB 'claim' update so multiple processes don't duplicate-post.
     """
+    global _empty_polls
     now = datetime.now(timezone.utc).isoformat()
     conn = db_connect()
+    # Plain tuples are enough here; skip the per-row sqlite3.Row wrapper.
+    conn.row_factory = None
     try:
-        due = conn.execute(
-            """
-            SELECT id, run_at, text, cookies_json
-            FROM scheduled_posts
-            WHERE status = 'pending' AND run_at <= ?
-            ORDER BY run_at ASC
-            LIMIT 25
-            """,
-            (now,),
-        ).fetchall()
-
-        for row in due:
-            post_id = int(row["id"])
-            claimed = conn.execute(
-                "UPDATE scheduled_posts SET status = 'processing' WHERE id = ? AND status = 'pending'",
-                (post_id,),
-            ).rowcount
+        # Atomically claim and read the due batch in a single statement
+        # (RETURNING needs SQLite 3.35+). One commit replaces the old
+        # SELECT + per-row claim UPDATE round-trips.
+        cursor = conn.execute(SQL_CLAIM_BATCH, (now,))
+
+        claimed = 0
+        done_ids = []
+        failed = []
+        # The posts are independent network calls, so run them
+        # concurrently. 8 workers keeps us polite with LinkedIn while
+        # cutting cycle latency from N round-trips to roughly one.
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            futures = {}
+            # Iterate the RETURNING cursor directly instead of fetchall():
+            # each row (and its cookies_json blob) is handed to the pool
+            # and released, rather than the whole batch being held in a
+            # list for the duration of the cycle.
+            for row in cursor:
+                claimed += 1
+                post_id = int(row[0])
+                try:
+                    cookies = orjson.loads(row[2] or "{}")
+                    text = row[1] or ""
+                except Exception as e:
+                    failed.append((str(e), post_id))
+                    continue
+                futures[executor.submit(post_to_linkedin_with_cookies, cookies, text)] = post_id
+                del row, cookies, text
             conn.commit()
-            if claimed != 1:
-                continue
 
+            for future in as_completed(futures):
+                post_id = futures[future]
+                try:
+                    result = future.result()
+                    if result.get("success"):
+                        done_ids.append((post_id,))
+                    else:
+                        failed.append((str(result.get("error") or "Failed to create post"), post_id))
+                except Exception as e:
+                    failed.append((str(e), post_id))
+
+        if not claimed:
+            # No pointless 30s polling against an empty queue: double the
+            # interval each idle cycle, up to 5 minutes. /schedule-post
+            # drops it back when near-term work arrives.
+            _empty_polls += 1
+            interval = min(MAX_POLL_INTERVAL_SECONDS, POLL_INTERVAL_SECONDS * 2 ** _empty_polls)
+            # Under gunicorn, /schedule-post may land in a worker whose
+            # scheduler never started and so can't reset our interval.
+            # The table is the cross-process signal: never back off past
+            # the next pending run_at.
             try:
-                cookies = json.loads(row["cookies_json"] or "{}")
-                text = row["text"] or ""
-                result = post_to_linkedin_with_cookies(cookies, text)
-                if result.get("success"):
-                    conn.execute(
-                        "UPDATE scheduled_posts SET status = 'done', last_error = NULL WHERE id = ?",
-                        (post_id,),
-                    )
-                else:
-                    conn.execute(
-                        "UPDATE scheduled_posts SET status = 'failed', last_error = ? WHERE id = ?",
-                        (str(result.get("error") or "Failed to create post"), post_id),
-                    )
-                conn.commit()
-            except Exception as e:
-                conn.execute(
-                    "UPDATE scheduled_posts SET status = 'failed', last_error = ? WHERE id = ?",
-                    (str(e), post_id),
-                )
-                conn.commit()
+                row = conn.execute(
+                    "SELECT MIN(run_at) FROM scheduled_posts WHERE status = 'pending'"
+                ).fetchone()
+                if row and row[0]:
+                    until_next = (
+                        datetime.fromisoformat(row[0]) - datetime.now(timezone.utc)
+                    ).total_seconds()
+                    interval = min(interval, max(1, int(until_next)))
+            except Exception:
+                pass  # fall back to plain exponential backoff
+            _set_poll_interval(interval)
+        else:
+            _empty_polls = 0
+            _set_poll_interval(POLL_INTERVAL_SECONDS)
+
+        # Hand all terminal statuses to the writer thread; they land in a
+        # single transaction there. Wait for the commit so a crash between
+        # cycles can't lose the outcome silently.
+        futures = []
+        if done_ids:
+            futures.append(_enqueue_write(SQL_MARK_DONE, done_ids, many=True))
+        if failed:
+            futures.append(_enqueue_write(SQL_MARK_FAILED, failed, many=True))
+        for f in futures:
+            f.result()
+    finally:
+        conn.close()
+
+
+def cleanup_old_posts():
+    """
+    Low-frequency housekeeping: drop week-old done/failed rows so the
+    table stays small, then fold the WAL file back into the main DB.
+    """
+    _enqueue_write(
+        "DELETE FROM scheduled_posts WHERE status IN ('done','failed') AND run_at < datetime('now','-7 days')"
+    ).result()
+    conn = db_connect()
+    try:
+        conn.execute("PRAGMA wal_checkpoint(TRUNCATE);")
     finally:
         conn.close()
 
 
 init_db()
 
+# Single serialized writer for all scheduled_posts mutations.
+_writer_thread = threading.Thread(target=_writer_loop, name="sqlite-writer", daemon=True)
+_writer_thread.start()
+
 # Background scheduler (server-side). This is what allows posting even if the user's laptop is off.
+# Under gunicorn, every worker imports this module; set RUN_SCHEDULER=0 on
+# all but one worker so a single leader polls the queue, instead of N
+# workers multiplying the DB load and racing to claim the same rows.
 scheduler = BackgroundScheduler(timezone="UTC")
-scheduler.add_job(process_due_posts, "interval", seconds=30, id="process_due_posts", replace_existing=True)
-scheduler.start()
+scheduler.add_job(process_due_posts, "interval", seconds=POLL_INTERVAL_SECONDS, id="process_due_posts", replace_existing=True)
+scheduler.add_job(cleanup_old_posts, "interval", hours=6, id="cleanup_old_posts", replace_existing=True)
+if os.getenv("RUN_SCHEDULER", "1") == "1":
+    scheduler.start()
 
 
 @app.route("/")
@@ -183,14 +406,18 @@ def callback():
     }
 
     try:
-        token_response = requests.post(token_url, data=data)
+        token_response = _oauth_session.post(token_url, data=data, timeout=(3, 10))
         token_data = token_response.json()
         access_token = token_data.get("access_token", "No Token Returned")
     except Exception as e:
         access_token = f"Error: {e}"
 
-    # WhatsApp-like UI
-    return f"""
+    return CALLBACK_TMPL.format(code=code, state=state, token=access_token)
+
+
+# WhatsApp-like UI for /callback, built once at import; only the three
+# values vary per request.
+CALLBACK_TMPL = """
     <html>
     <head>
         <title>LinkedIn OAuth</title>
@@ -233,7 +460,7 @@ def callback():
                             border-radius:6px;
                             font-size:14px;
                             word-wrap:break-word;
-                        '>{access_token}</div>
+                        '>{token}</div>
                     </p>
                 </div>
             </div>
@@ -243,24 +470,44 @@ def callback():
     </html>
     """
 
-def create_linkedin_api_with_cookies(cookies):
+@lru_cache(maxsize=512)
+def get_api(li_at, jsessionid):
     """
-    Helper function to create a Linkedin API instance with cookies.
+    Return a cached Linkedin client for this li_at/JSESSIONID pair.
+
+    Reusing one requests.Session per cookie set lets consecutive LinkedIn
+    calls ride pooled keep-alive HTTPS connections instead of paying a
+    fresh TCP+TLS handshake every time.
     """
-    # Initialize API without loading cookies from file
     api = Linkedin(skip_cookie_load=True)
-    
-    # Set cookies directly
-    for name, value in cookies.items():
-        api.client.session.cookies.set(name, value, domain='.linkedin.com')
-    
+    api.client.session.mount("https://", HTTPAdapter(pool_connections=32, pool_maxsize=32))
+    api.client.session.cookies.set("li_at", li_at, domain='.linkedin.com')
+    api.client.session.cookies.set("JSESSIONID", jsessionid, domain='.linkedin.com')
+
     # Set CSRF token from JSESSIONID
-    jsessionid = cookies.get("JSESSIONID", "").replace('"', '')
-    if jsessionid:
+    csrf = jsessionid.replace('"', '')
+    if csrf:
         api.client.session.headers.update({
-            "csrf-token": jsessionid
+            "csrf-token": csrf
         })
-    
+
+    return api
+
+
+def create_linkedin_api_with_cookies(cookies):
+    """
+    Helper function to create a Linkedin API instance with cookies.
+    """
+    api = get_api(cookies.get("li_at", ""), cookies.get("JSESSIONID", ""))
+
+    # Carry over any extra cookies the extension sent (e.g. liap).
+    # Build domain-scoped Cookie objects directly and feed them straight
+    # into the jar, skipping Session.cookies.set()'s per-call wrapping.
+    jar = api.client.session.cookies
+    for name, value in cookies.items():
+        if name not in ("li_at", "JSESSIONID"):
+            jar.set_cookie(create_cookie(name, value, domain='.linkedin.com'))
+
     return api
 
 
@@ -292,27 +539,60 @@ def verify_cookies():
         return jsonify({"status": "error", "message": str(e)}), 401
 
 
+# Short-lived profile cache: the extension may call /get-profile several
+# times per session and the answer barely changes within a minute.
+_profile_cache = TTLCache(maxsize=1024, ttl=60)
+_profile_cache_lock = threading.Lock()
+
+
 @app.route("/get-profile", methods=["POST"])
 def get_profile():
     """
     Get user profile using provided cookies.
+    Responses are cached per li_at for 60s and served with an ETag, so
+    repeat callers get a 304 (or a cache hit) instead of a Voyager call.
     """
     data = request.get_json()
     cookies = data.get("cookies")
-    
+
     if not cookies:
         return jsonify({"status": "error", "message": "Missing cookies."}), 400
-    
-    try:
-        api = create_linkedin_api_with_cookies(cookies)
-        profile = api.get_user_profile()
-        
-        return jsonify({
-            "status": "success",
-            "profile": profile
-        })
-    except Exception as e:
-        return jsonify({"status": "error", "message": str(e)}), 500
+
+    li_at = cookies.get("li_at", "")
+    with _profile_cache_lock:
+        cached = _profile_cache.get(li_at)
+
+    if cached is None:
+        try:
+            api = create_linkedin_api_with_cookies(cookies)
+            profile = api.get_user_profile()
+        except Exception as e:
+            return jsonify({"status": "error", "message": str(e)}), 500
+
+        fetched_at = datetime.now(timezone.utc).isoformat()
+        etag = md5(f"{li_at}{fetched_at}".encode()).hexdigest()
+        cached = (profile, etag)
+        with _profile_cache_lock:
+            _profile_cache[li_at] = cached
+
+    profile, etag = cached
+    # The ETag is weak on purpose: flask-compress rewrites strong ETags
+    # on gzipped responses to "<digest>:gzip", which would never match
+    # the bare digest on revalidation. Weak validators pass through
+    # untouched. if_none_match also handles the quoting set_etag applies.
+    if request.if_none_match.contains_weak(etag):
+        resp = app.response_class(status=304)
+        resp.set_etag(etag, weak=True)
+        resp.headers["Cache-Control"] = "private, max-age=60"
+        return resp
+
+    resp = jsonify({
+        "status": "success",
+        "profile": profile
+    })
+    resp.set_etag(etag, weak=True)
+    resp.headers["Cache-Control"] = "private, max-age=60"
+    return resp
 
 
 @app.route("/post-to-linkedin", methods=["POST"])
@@ -374,22 +654,22 @@ def start_browser_login():
             # Step 2: Go to LinkedIn
             page.goto("https://www.linkedin.com/login")
 
-            # Step 3: Wait loop for 'li_at' cookie
+            # Step 3: Wait for login to finish (event-driven, no poll loop).
+            # li_at is HttpOnly so document.cookie never shows it; landing
+            # on the feed is the reliable logged-in signal.
             print("Waiting for user to login...")
-            max_retries = 60 # Wait up to 60 seconds (approx)
             logged_in = False
-            
-            for _ in range(max_retries):
-                cookies = context.cookies()
-                cookie_dict = {c['name']: c['value'] for c in cookies}
-                
+
+            try:
+                page.wait_for_url("**/feed/**", timeout=60000)
+                cookie_dict = {c['name']: c['value'] for c in context.cookies()}
+
                 if 'li_at' in cookie_dict and 'JSESSIONID' in cookie_dict:
                     extracted_cookies = cookie_dict
                     logged_in = True
-                    break
-                
-                time.sleep(1) # Check every 1 second
-            
+            except PlaywrightTimeoutError:
+                pass
+
             browser.close()
             
             if logged_in:
@@ -416,40 +696,69 @@ def schedule_post():
     """
     data = request.get_json() or {}
     cookies = data.get("cookies") or {}
-    text = StringOrNone = data.get("text")
+    text = data.get("text")
     run_at = data.get("run_at")
 
     if not isinstance(cookies, dict) or not cookies.get("li_at") or not cookies.get("JSESSIONID"):
         return jsonify({"status": "error", "message": "Missing LinkedIn cookies."}), 400
-    if not text or not str(text).strip():
+    text_clean = str(text).strip() if text else ""
+    if not text_clean:
         return jsonify({"status": "error", "message": "Missing post text."}), 400
     try:
         run_dt = parse_iso_datetime(run_at)
     except Exception as e:
         return jsonify({"status": "error", "message": f"Invalid run_at: {e}"}), 400
 
-    conn = db_connect()
-    try:
-        created_at = datetime.now(timezone.utc).isoformat()
-        run_at_iso = run_dt.isoformat()
-        cur = conn.execute(
-            """
-            INSERT INTO scheduled_posts(created_at, run_at, status, text, cookies_json, last_error)
-            VALUES(?, ?, 'pending', ?, ?, NULL)
-            """,
-            (created_at, run_at_iso, str(text).strip(), json.dumps({"li_at": cookies["li_at"], "JSESSIONID": cookies["JSESSIONID"]})),
-        )
-        conn.commit()
-        return jsonify(
-            {
-                "status": "success",
-                "id": cur.lastrowid,
-                "run_at": run_at_iso,
-                "message": "Post scheduled.",
-            }
-        )
-    finally:
-        conn.close()
+    created_at = datetime.now(timezone.utc).isoformat()
+    run_at_iso = run_dt.isoformat()
+    post_id = _enqueue_write(
+        SQL_INSERT_POST,
+        (
+            created_at,
+            run_at_iso,
+            text_clean,
+            # orjson output is already compact (no whitespace)
+            orjson.dumps(
+                {"li_at": cookies["li_at"], "JSESSIONID": cookies["JSESSIONID"]}
+            ).decode(),
+        ),
+    ).result()
+
+    # If the queue had gone idle and polling backed off, bring the
+    # interval back down so a near-term post isn't left waiting. Both
+    # scheduler tweaks only make sense in the worker that actually runs
+    # the scheduler: add_job on a never-started scheduler just piles up
+    # pending jobs that never fire. In RUN_SCHEDULER=0 workers the
+    # leader's own poll spots the new pending row before backing off.
+    global _empty_polls
+    delta = (run_dt - datetime.now(timezone.utc)).total_seconds()
+    if scheduler.running:
+        if delta < _poll_seconds:
+            _empty_polls = 0
+            _set_poll_interval(POLL_INTERVAL_SECONDS)
+
+        # For posts due before the next regular poll, fire a one-shot run
+        # at the exact time instead of waiting out the interval.
+        if delta < 60:
+            try:
+                scheduler.add_job(
+                    process_due_posts,
+                    "date",
+                    run_date=run_dt,
+                    id=f"oneshot-{post_id}",
+                    misfire_grace_time=30,
+                )
+            except Exception:
+                pass  # scheduler shutting down
+
+    return jsonify(
+        {
+            "status": "success",
+            "id": post_id,
+            "run_at": run_at_iso,
+            "message": "Post scheduled.",
+        }
+    )
 
 
 @app.route("/clear-scheduled", methods=["POST"])
@@ -457,13 +766,8 @@ def clear_scheduled():
     """
     Best-effort: clear all scheduled posts (used on logout).
     """
-    conn = db_connect()
-    try:
-        conn.execute("DELETE FROM scheduled_posts;")
-        conn.commit()
-        return jsonify({"status": "success", "message": "Cleared scheduled posts."})
-    finally:
-        conn.close()
+    _enqueue_write("DELETE FROM scheduled_posts;").result()
+    return jsonify({"status": "success", "message": "Cleared scheduled posts."})
 
 
 if __name__ == "__main__":
@@ -2,14 +2,52 @@
 Client module for LinkedIn API
 """
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
 import logging
+import threading
+from time import monotonic, sleep
 
 import linkedin_api.settings as settings
 
+# Configure logging once at import; Client.__init__ only adjusts the
+# logger's level, so instantiating many clients stays cheap.
+logging.basicConfig(level=logging.INFO)
+
 logger = logging.getLogger(__name__)
 
 
+class TokenBucket(object):
+    """
+    Thread-safe token bucket used to pace LinkedIn API calls. Unlike the
+    old fixed random sleeps, acquire() returns immediately while the
+    recent-request budget lasts and only sleeps once it is exhausted.
+    """
+
+    def __init__(self, rate=1.0, capacity=5):
+        self.rate = rate  # tokens refilled per second
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """
+        Take one token, sleeping until one is available.
+        """
+        while True:
+            with self._lock:
+                now = monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            sleep(wait)
+
+
 class Client(object):
     """
     Class to act as a client for the Linkedin API.
@@ -23,6 +61,7 @@ class Client(object):
         "Accept-Language": "en-US,en;q=0.9",
         "x-li-lang": "en_US",
         "x-restli-protocol-version": "2.0.0",
+        "Connection": "keep-alive",
     }
 
     def __init__(self, debug=False, refresh_cookies=False, skip_cookie_load=False):
@@ -36,10 +75,56 @@ class Client(object):
         """
         self.session = requests.session()
         self.session.headers.update(Client.REQUEST_HEADERS)
+        # All calls hit the one LinkedIn host; keep a pool of warm
+        # keep-alive connections so chatty call sequences (search pages,
+        # profile fetches) skip the TCP+TLS handshake. Rate-limit (429)
+        # and transient 5xx responses are retried with exponential
+        # backoff, honoring any Retry-After header, instead of surfacing
+        # straight to the caller as a failure. The default allowed_methods
+        # excludes POST, which is exactly what we want here: a 5xx can
+        # arrive after the server already applied the write.
+        def _adapter(retry):
+            return HTTPAdapter(
+                pool_connections=1,
+                pool_maxsize=32,
+                pool_block=False,
+                max_retries=retry,
+            )
+
+        self.session.mount(
+            "https://",
+            _adapter(
+                Retry(
+                    total=5,
+                    backoff_factor=1.0,
+                    status_forcelist=(429, 500, 502, 503, 504),
+                    respect_retry_after_header=True,
+                )
+            ),
+        )
+        # create_post POSTs to /graphql. Re-sending it after a 5xx could
+        # publish a duplicate share on the user's feed, so only 429 — a
+        # response that guarantees nothing was applied — is retried there.
+        self.session.mount(
+            Client.API_BASE_URL + "/graphql",
+            _adapter(
+                Retry(
+                    total=5,
+                    backoff_factor=1.0,
+                    status_forcelist=(429,),
+                    allowed_methods=None,
+                    respect_retry_after_header=True,
+                )
+            ),
+        )
+
+        # Shared pacing for every API method on this client
+        self.bucket = TokenBucket(rate=1.0, capacity=5)
 
         self.logger = logger
-        logging.basicConfig(level=logging.DEBUG if debug else logging.INFO)
-        
+        if debug:
+            self.logger.setLevel(logging.DEBUG)
+
         # Load cookies from JSON file (unless skipped)
         if not skip_cookie_load:
             self._load_cookies_from_json()
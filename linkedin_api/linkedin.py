@@ -1,14 +1,252 @@
 """
 Provides linkedin api-related code
 """
-import random
 import logging
-from time import sleep
+import sys
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import wraps
+from time import monotonic
+from types import MappingProxyType
+from typing import List, Optional
 
 from linkedin_api.client import Client
 
+try:
+    import orjson
+
+    _loads = orjson.loads
+    _dumps = orjson.dumps
+except ImportError:  # fall back to stdlib when orjson isn't installed
+    import json
+
+    _loads = json.loads
+
+    def _dumps(obj):
+        return json.dumps(obj).encode()
+
+try:
+    import ijson
+except ImportError:  # streaming parse is optional; fall back to full parse
+    ijson = None
+
+try:
+    import msgspec
+except ImportError:  # typed decode is optional; fall back to dict parse
+    msgspec = None
+
 logger = logging.getLogger(__name__)
 
+# $type tags used to pick entries out of Voyager responses, interned once
+# so every call site shares a single string object instead of re-hashing
+# a fresh literal.
+_T_MINIPROFILE = sys.intern("com.linkedin.voyager.identity.shared.MiniProfile")
+_T_SOCIAL_CONTENT = sys.intern("com.linkedin.voyager.dash.social.SocialContent")
+_T_FEED_UPDATE = sys.intern("com.linkedin.voyager.dash.feed.Update")
+_T_STD_WEBSITE = sys.intern("com.linkedin.voyager.identity.profile.StandardWebsite")
+_T_CUSTOM_WEBSITE = sys.intern("com.linkedin.voyager.identity.profile.CustomWebsite")
+_T_VECTOR_IMAGE = sys.intern("com.linkedin.common.VectorImage")
+
+if msgspec is not None:
+    # Typed schemas for the slice of the /me response get_user_profile
+    # actually reads. msgspec decodes straight into these C-level structs
+    # (unknown fields are skipped), avoiding the intermediate dict/list
+    # tree a generic parse would build.
+    class _MeData(msgspec.Struct):
+        plainId: Optional[int] = None
+        premiumSubscriber: Optional[bool] = None
+
+    class _MeIncluded(msgspec.Struct):
+        type: Optional[str] = msgspec.field(name="$type", default=None)
+        firstName: Optional[str] = None
+        lastName: Optional[str] = None
+        occupation: Optional[str] = None
+        publicIdentifier: Optional[str] = None
+        entityUrn: Optional[str] = None
+        objectUrn: Optional[str] = None
+
+    class _MeResponse(msgspec.Struct):
+        data: Optional[_MeData] = None
+        included: List[_MeIncluded] = msgspec.field(default_factory=list)
+
+    _ME_DECODER = msgspec.json.Decoder(_MeResponse)
+else:
+    _ME_DECODER = None
+
+# create_post constants: only text and visibility vary per call, so the
+# queryId, URL params, and headers are built once at import.
+# Endpoint discovered from browser network inspection; the queryId is
+# part of the URL, not the payload.
+_CREATE_POST_QUERY_ID = "voyagerContentcreationDashShares.279996efa5064c01775d5aff003d9377"
+_CREATE_POST_PARAMS = MappingProxyType({
+    "action": "execute",
+    "queryId": _CREATE_POST_QUERY_ID,
+})
+# The payload skeleton is serialized once; per call only the two
+# variable fields (visibility enum, JSON-escaped text) are rendered and
+# spliced in, skipping the nested dict build and full encode.
+_CREATE_POST_TEMPLATE = (
+    b'{"variables":{"post":{"allowedCommentersScope":"ALL",'
+    b'"intendedShareLifeCycleState":"PUBLISHED","origin":"FEED",'
+    b'"visibilityDataUnion":{"visibilityType":%s},'
+    b'"commentary":{"text":%s,"attributesV2":[]}}},'
+    b'"queryId":"' + _CREATE_POST_QUERY_ID.encode() + b'"}'
+)
+# Only the Content-Type differs from the session defaults installed by
+# Client.__init__ (accept, x-restli-protocol-version, x-li-lang), so the
+# per-call header merge stays a single entry.
+_CREATE_POST_HEADERS = MappingProxyType({
+    "Content-Type": "application/json; charset=UTF-8",
+})
+
+# Share-URL extractors keyed by $type, checked in preference order. New
+# response shapes get a new entry here instead of another if/elif branch
+# in create_post.
+_URL_EXTRACTORS = {
+    _T_SOCIAL_CONTENT: lambda it: it.get("shareUrl"),
+    _T_FEED_UPDATE: lambda it: it.get("socialContent", {}).get("shareUrl"),
+}
+
+
+# Organization "decoration" field lists, collapsed to single-line form
+# once at import: the old triple-quoted inline versions re-allocated the
+# string per call and shipped hundreds of bytes of whitespace on every
+# request URL.
+_SCHOOL_DECORATION = "".join(
+    """
+    (
+    autoGenerated,backgroundCoverImage,
+    companyEmployeesSearchPageUrl,companyPageUrl,confirmedLocations*,coverPhoto,dataVersion,description,
+    entityUrn,followingInfo,foundedOn,headquarter,jobSearchPageUrl,lcpTreatment,logo,name,type,overviewPhoto,
+    paidCompany,partnerCompanyUrl,partnerLogo,partnerLogoImage,rankForTopCompanies,salesNavigatorCompanyUrl,
+    school,showcase,staffCount,staffCountRange,staffingCompany,topCompaniesListName,universalName,url,
+    companyIndustries*,industries,specialities,
+    acquirerCompany~(entityUrn,logo,name,industries,followingInfo,url,paidCompany,universalName),
+    affiliatedCompanies*~(entityUrn,logo,name,industries,followingInfo,url,paidCompany,universalName),
+    groups*~(entityUrn,largeLogo,groupName,memberCount,websiteUrl,url),
+    showcasePages*~(entityUrn,logo,name,industries,followingInfo,url,description,universalName)
+    )
+    """.split()
+)
+_COMPANY_DECORATION = "".join(
+    """
+    (
+    affiliatedCompaniesWithEmployeesRollup,affiliatedCompaniesWithJobsRollup,articlePermalinkForTopCompanies,
+    autoGenerated,backgroundCoverImage,companyEmployeesSearchPageUrl,
+    companyPageUrl,confirmedLocations*,coverPhoto,dataVersion,description,entityUrn,followingInfo,
+    foundedOn,headquarter,jobSearchPageUrl,lcpTreatment,logo,name,type,overviewPhoto,paidCompany,
+    partnerCompanyUrl,partnerLogo,partnerLogoImage,permissions,rankForTopCompanies,
+    salesNavigatorCompanyUrl,school,showcase,staffCount,staffCountRange,staffingCompany,
+    topCompaniesListName,universalName,url,companyIndustries*,industries,specialities,
+    acquirerCompany~(entityUrn,logo,name,industries,followingInfo,url,paidCompany,universalName),
+    affiliatedCompanies*~(entityUrn,logo,name,industries,followingInfo,url,paidCompany,universalName),
+    groups*~(entityUrn,largeLogo,groupName,memberCount,websiteUrl,url),
+    showcasePages*~(entityUrn,logo,name,industries,followingInfo,url,description,universalName)
+    )
+    """.split()
+)
+_SCHOOL_PARAMS_BASE = MappingProxyType({
+    "decoration": _SCHOOL_DECORATION,
+    "q": "universalName",
+})
+_COMPANY_PARAMS_BASE = MappingProxyType({
+    "decoration": _COMPANY_DECORATION,
+    "q": "universalName",
+})
+
+
+_TTL_CACHE_MAX_SIZE = 256
+
+
+def _ttl_cached(ttl=300):
+    """
+    Cache an idempotent GET method's result for [ttl] seconds, keyed on
+    the method name and its arguments. A hit skips the rate-limiter wait,
+    the network round-trip, and the JSON parse entirely.
+
+    Concurrent identical calls are deduplicated: the first caller does
+    the real fetch while the others wait on its Future, so a thundering
+    herd costs one upstream request (and one rate-limit hit), not N.
+    """
+    def decorator(fn):
+        cache = {}
+        inflight = {}
+        lock = threading.Lock()
+
+        @wraps(fn)
+        def wrapper(self, *args, **kwargs):
+            key = (fn.__name__, args, tuple(sorted(kwargs.items())))
+            now = monotonic()
+            with lock:
+                hit = cache.get(key)
+                if hit is not None and hit[0] > now:
+                    return hit[1]
+                future = inflight.get(key)
+                if future is None:
+                    future = Future()
+                    inflight[key] = future
+                    owner = True
+                else:
+                    owner = False
+
+            if not owner:
+                # Someone else is already fetching this key; share theirs.
+                return future.result()
+
+            try:
+                value = fn(self, *args, **kwargs)
+            except BaseException as e:
+                with lock:
+                    inflight.pop(key, None)
+                future.set_exception(e)
+                raise
+
+            with lock:
+                if len(cache) >= _TTL_CACHE_MAX_SIZE:
+                    cache.pop(next(iter(cache)))
+                cache[key] = (monotonic() + ttl, value)
+                inflight.pop(key, None)
+            future.set_result(value)
+            return value
+
+        return wrapper
+
+    return decorator
+
+
+# The only top-level subtrees of a profileView response get_profile reads
+_PROFILE_VIEW_KEYS = frozenset(("profile", "positionView", "skillView", "educationView", "status", "message"))
+
+
+def _load_profile_view(res):
+    """
+    Decode a profileView response. When ijson is available the body is
+    stream-parsed one top-level subtree at a time and everything outside
+    the few views get_profile actually reads is dropped as it goes past,
+    so peak memory is one subtree rather than the whole document.
+    """
+    if ijson is None:
+        return _loads(res.content)
+
+    res.raw.decode_content = True  # ijson reads the raw stream; un-gzip it
+    data = {}
+    for key, value in ijson.kvitems(res.raw, ""):
+        if key in _PROFILE_VIEW_KEYS:
+            data[key] = value
+    return data
+
+
+def _index_included(data):
+    """
+    Index a response's "included" entries by their $type, so picking an
+    entry out is a dict hit instead of a linear scan over what can be
+    hundreds of items.
+    """
+    idx = {}
+    for item in data.get("included", ()):
+        idx.setdefault(item.get("$type"), []).append(item)
+    return idx
+
 
 class Linkedin(object):
     """
@@ -30,6 +268,13 @@ class Linkedin(object):
         self.client = Client(debug=debug, refresh_cookies=refresh_cookies, skip_cookie_load=skip_cookie_load)
         self.logger = logger
 
+        # Fixed endpoint URLs, built once instead of per call
+        base = self.client.API_BASE_URL
+        self._url_me = f"{base}/me"
+        self._url_graphql = f"{base}/graphql"
+        self._url_search = f"{base}/search/cluster"
+        self._url_organizations = f"{base}/organization/companies"
+
     def get_user_profile(self):
         """
         Get the current authenticated user's profile.
@@ -37,30 +282,54 @@ class Linkedin(object):
         Returns:
             Dictionary with user profile data
         """
-        res = self.client.session.get(f"{self.client.API_BASE_URL}/me")
+        res = self.client.session.get(self._url_me)
         
         if res.status_code != 200:
             self.logger.error(f"Failed to get user profile: {res.status_code} - {res.text}")
             return {}
         
-        data = res.json()
-        
+        if _ME_DECODER is not None:
+            # Typed decode: only the fields declared on the structs are
+            # materialized, and a shape mismatch surfaces here instead of
+            # as a KeyError later. Fall back to the dict path if the
+            # response has drifted from the schema.
+            try:
+                me = _ME_DECODER.decode(res.content)
+            except msgspec.DecodeError as e:
+                self.logger.debug(f"Typed decode of /me failed, falling back: {e}")
+            else:
+                result = {
+                    "plain_id": me.data.plainId if me.data else None,
+                    "premium_subscriber": me.data.premiumSubscriber if me.data else None,
+                }
+                mini_profile = next(
+                    (item for item in me.included if item.type == _T_MINIPROFILE), None
+                )
+                if mini_profile:
+                    result.update({
+                        "first_name": mini_profile.firstName,
+                        "last_name": mini_profile.lastName,
+                        "occupation": mini_profile.occupation,
+                        "public_identifier": mini_profile.publicIdentifier,
+                        "entity_urn": mini_profile.entityUrn,
+                        "object_urn": mini_profile.objectUrn,
+                    })
+                return result
+
+        data = _loads(res.content)
+
         # Extract user info from response
         user_data = data.get("data", {})
-        included = data.get("included", [])
-        
+
         # Find mini profile in included
-        mini_profile = None
-        for item in included:
-            if item.get("$type") == "com.linkedin.voyager.identity.shared.MiniProfile":
-                mini_profile = item
-                break
-        
+        idx = _index_included(data)
+        mini_profile = next(iter(idx.get(_T_MINIPROFILE, ())), None)
+
         result = {
             "plain_id": user_data.get("plainId"),
             "premium_subscriber": user_data.get("premiumSubscriber"),
         }
-        
+
         if mini_profile:
             result.update({
                 "first_name": mini_profile.get("firstName"),
@@ -70,7 +339,7 @@ class Linkedin(object):
                 "entity_urn": mini_profile.get("entityUrn"),
                 "object_urn": mini_profile.get("objectUrn"),
             })
-        
+
         return result
 
     def create_post(self, text, visibility="ANYONE"):
@@ -84,51 +353,18 @@ class Linkedin(object):
         Returns:
             dict: Response data from the API including post URL and status
         """
-        # Endpoint discovered from browser network inspection
-        # The queryId is part of the URL, not the payload
-        endpoint = f"{self.client.API_BASE_URL}/graphql"
-        
-        params = {
-            "action": "execute",
-            "queryId": "voyagerContentcreationDashShares.279996efa5064c01775d5aff003d9377"
-        }
-        
-        payload = {
-            "variables": {
-                "post": {
-                    "allowedCommentersScope": "ALL",
-                    "intendedShareLifeCycleState": "PUBLISHED",
-                    "origin": "FEED",
-                    "visibilityDataUnion": {
-                        "visibilityType": visibility
-                    },
-                    "commentary": {
-                        "text": text,
-                        "attributesV2": []
-                    }
-                }
-            },
-            "queryId": "voyagerContentcreationDashShares.279996efa5064c01775d5aff003d9377"
-        }
-        
-        # Required headers based on successful browser request
-        headers = {
-            "Content-Type": "application/json; charset=UTF-8",
-            "accept": "application/vnd.linkedin.normalized+json+2.1",
-            "x-restli-protocol-version": "2.0.0",
-            "x-li-lang": "en_US",
-        }
-        
+        body = _CREATE_POST_TEMPLATE % (_dumps(visibility), _dumps(text))
+
         try:
             res = self.client.session.post(
-                endpoint,
-                params=params,
-                json=payload,
-                headers=headers
+                self._url_graphql,
+                params=_CREATE_POST_PARAMS,
+                data=body,
+                headers=_CREATE_POST_HEADERS
             )
             
             if res.status_code == 200:
-                data = res.json()
+                data = _loads(res.content)
                 self.logger.info("✅ Post created successfully!")
                 
                 # Extract useful information from response
@@ -140,14 +376,13 @@ class Linkedin(object):
                 
                 # Try to extract the post URL from the response
                 try:
-                    if "included" in data:
-                        for item in data["included"]:
-                            if item.get("$type") == "com.linkedin.voyager.dash.social.SocialContent":
-                                result["post_url"] = item.get("shareUrl")
-                                break
-                            elif item.get("$type") == "com.linkedin.voyager.dash.feed.Update":
-                                social_content = item.get("socialContent", {})
-                                result["post_url"] = social_content.get("shareUrl")
+                    idx = _index_included(data)
+                    for type_tag, extract in _URL_EXTRACTORS.items():
+                        items = idx.get(type_tag)
+                        if items:
+                            url = extract(items[0])
+                            if url:
+                                result["post_url"] = url
                                 break
                 except Exception as e:
                     self.logger.debug(f"Could not extract post URL: {e}")
@@ -168,45 +403,57 @@ class Linkedin(object):
                 "error": str(e)
             }
 
-    def search(self, params, max_results=None, results=[]):
+    def search(self, params, max_results=None):
         """
         Do a search.
-        """
-        sleep(random.randint(0, 1))  # sleep a random duration to try and evade suspention
 
+        The first page reveals paging.total, so every remaining offset is
+        known up front; those pages are fetched concurrently (8 at a time,
+        to stay polite) over the shared keep-alive session instead of one
+        serial round-trip per page.
+        """
         count = max_results if max_results and max_results <= Linkedin._MAX_SEARCH_COUNT else Linkedin._MAX_SEARCH_COUNT
         default_params = {
             "count": count,
             "guides": "List()",
             "origin": "GLOBAL_SEARCH_HEADER",
             "q": "guided",
-            "start": len(results),
+            "start": 0,
         }
 
         default_params.update(params)
 
-        res = self.client.session.get(
-            f"{self.client.API_BASE_URL}/search/cluster", params=default_params)
-        data = res.json()
+        url = self._url_search
+
+        def fetch_page(start):
+            self.client.bucket.acquire()  # pace requests instead of a blind random sleep
+            res = self.client.session.get(url, params={**default_params, "start": start})
+            return _loads(res.content)
+
+        data = fetch_page(0)
 
         total_found = data.get("paging", {}).get("total")
         if total_found == 0 or total_found is None:
             self.logger.debug("found none...")
             return []
 
-        # recursive base case
-        if (
-            len(data["elements"]) == 0
-            or (max_results is not None and len(results) >= max_results)
-            or len(results) >= total_found
-            or len(results) / max_results >= Linkedin._MAX_REPEATED_REQUESTS
-        ):
-            return results
+        results = []
+        if data["elements"]:
+            results.extend(data["elements"][0]["elements"])
+
+        limit = total_found if max_results is None else min(max_results, total_found)
+        offsets = list(range(count, limit, count))[: Linkedin._MAX_REPEATED_REQUESTS - 1]
 
-        results.extend(data["elements"][0]["elements"])
-        self.logger.debug(f"results grew: {len(results)}")
+        if offsets:
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                for page in executor.map(fetch_page, offsets):
+                    if page.get("elements"):
+                        results.extend(page["elements"][0]["elements"])
+                        self.logger.debug(f"results grew: {len(results)}")
 
-        return self.search(params, results=results, max_results=max_results)
+        if max_results is not None:
+            del results[max_results:]
+        return results
 
     def search_people(self, keywords=None, connection_of=None, network_depth=None, regions=None, industries=None, max_results=None):
         """
@@ -253,6 +500,7 @@ class Linkedin(object):
 
         return results
 
+    @_ttl_cached(300)
     def get_profile_contact_info(self, public_id=None, urn_id=None):
         """
         Return data for a single profile's contact info.
@@ -264,7 +512,7 @@ class Linkedin(object):
         res = self.client.session.get(
             f"{self.client.API_BASE_URL}/identity/profiles/{public_id or urn_id}/profileContactInfo"
         )
-        data = res.json()
+        data = _loads(res.content)
 
         contact_info = {
             "email_address": data.get("emailAddress"),
@@ -274,10 +522,10 @@ class Linkedin(object):
 
         websites = data.get("websites", [])
         for item in websites:
-            if "com.linkedin.voyager.identity.profile.StandardWebsite" in item["type"]:
-                item["label"] = item["type"]["com.linkedin.voyager.identity.profile.StandardWebsite"]["category"]
-            elif "com.linkedin.voyager.identity.profile.CustomWebsite" in item["type"]:
-                item["label"] = item["type"]["com.linkedin.voyager.identity.profile.CustomWebsite"]["label"]
+            if _T_STD_WEBSITE in item["type"]:
+                item["label"] = item["type"][_T_STD_WEBSITE]["category"]
+            elif _T_CUSTOM_WEBSITE in item["type"]:
+                item["label"] = item["type"][_T_CUSTOM_WEBSITE]["label"]
 
             del item["type"]
 
@@ -285,6 +533,7 @@ class Linkedin(object):
 
         return contact_info
 
+    @_ttl_cached(300)
     def get_profile(self, public_id=None, urn_id=None):
         """
         Return data for a single profile.
@@ -296,16 +545,17 @@ class Linkedin(object):
         Note: This endpoint may return 410 (Gone) errors as LinkedIn has deprecated it.
         Consider using get_user_profile() for the current user instead.
         """
-        sleep(random.randint(2, 5))  # sleep a random duration to try and evade suspention
+        self.client.bucket.acquire()  # pace requests instead of a blind random sleep
         res = self.client.session.get(
-            f"{self.client.API_BASE_URL}/identity/profiles/{public_id or urn_id}/profileView"
+            f"{self.client.API_BASE_URL}/identity/profiles/{public_id or urn_id}/profileView",
+            stream=ijson is not None,
         )
 
         if res.status_code != 200:
             self.logger.warning(f"Profile request failed with status {res.status_code}: {res.text}")
             return {}
 
-        data = res.json()
+        data = _load_profile_view(res)
 
         if data and "status" in data and data["status"] != 200:
             self.logger.info("request failed: {}".format(data.get("message", "Unknown error")))
@@ -315,16 +565,15 @@ class Linkedin(object):
             self.logger.warning("No profile data in response")
             return {}
 
-        # massage [profile] data
+        # massage [profile] data; hot subtrees are bound to locals so the
+        # per-item work is one dict lookup, not a repeated nested chain
         profile = data["profile"]
-        if "miniProfile" in profile:
-            if "picture" in profile["miniProfile"]:
-                profile["displayPictureUrl"] = profile["miniProfile"]["picture"]["com.linkedin.common.VectorImage"][
-                    "rootUrl"
-                ]
-            profile["profile_id"] = profile["miniProfile"]["entityUrn"].split(":")[3]
-
-            del profile["miniProfile"]
+        mini_profile = profile.pop("miniProfile", None)
+        if mini_profile:
+            picture = mini_profile.get("picture")
+            if picture:
+                profile["displayPictureUrl"] = picture[_T_VECTOR_IMAGE]["rootUrl"]
+            profile["profile_id"] = mini_profile["entityUrn"].split(":")[3]
 
         del profile["defaultLocale"]
         del profile["supportedLocales"]
@@ -334,13 +583,12 @@ class Linkedin(object):
         # massage [experience] data
         experience = data["positionView"]["elements"]
         for item in experience:
-            if "company" in item and "miniCompany" in item["company"]:
-                if "logo" in item["company"]["miniCompany"]:
-                    logo = item["company"]["miniCompany"]["logo"].get(
-                        "com.linkedin.common.VectorImage")
-                    if logo:
-                        item["companyLogoUrl"] = logo["rootUrl"]
-                del item["company"]["miniCompany"]
+            company = item.get("company")
+            mini_company = company.pop("miniCompany", None) if company else None
+            if mini_company:
+                logo = mini_company.get("logo", {}).get(_T_VECTOR_IMAGE)
+                if logo:
+                    item["companyLogoUrl"] = logo["rootUrl"]
 
         profile["experience"] = experience
 
@@ -352,15 +600,31 @@ class Linkedin(object):
         # massage [education] data
         education = data["educationView"]["elements"]
         for item in education:
-            if "school" in item:
-                if "logo" in item["school"]:
-                    item["school"]["logoUrl"] = item["school"]["logo"]["com.linkedin.common.VectorImage"]["rootUrl"]
-                    del item["school"]["logo"]
+            school = item.get("school")
+            if school:
+                logo = school.pop("logo", None)
+                if logo:
+                    school["logoUrl"] = logo[_T_VECTOR_IMAGE]["rootUrl"]
 
         profile["education"] = education
 
         return profile
 
+    def get_profiles_bulk(self, ids, workers=8):
+        """
+        Return profiles for several ids, fetched concurrently.
+
+        Args:
+            ids: iterable of public identifiers (or URN ids)
+            workers: number of concurrent fetches
+
+        All fetches share the client's keep-alive connection pool and are
+        paced by its token bucket, so the fanout stays inside the usual
+        rate limits while overlapping the network round-trips.
+        """
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(self.get_profile, ids))
+
     def get_profile_connections(self, urn_id, max_results=None):
         """
         Return a list of profile ids connected to profile of given [urn_id]
@@ -371,6 +635,7 @@ class Linkedin(object):
         """
         return self.search_people(connection_of=urn_id, network_depth="F", max_results=max_results)
 
+    @_ttl_cached(300)
     def get_school(self, public_id):
         """
         Return data for a single school.
@@ -378,34 +643,15 @@ class Linkedin(object):
         Args:
             public_id: public identifier i.e. uq
         """
-        sleep(random.randint(2, 5))  # sleep a random duration to try and evade suspention
-        params = {
-            "decoration": (
-                """
-                (
-                autoGenerated,backgroundCoverImage,
-                companyEmployeesSearchPageUrl,companyPageUrl,confirmedLocations*,coverPhoto,dataVersion,description,
-                entityUrn,followingInfo,foundedOn,headquarter,jobSearchPageUrl,lcpTreatment,logo,name,type,overviewPhoto,
-                paidCompany,partnerCompanyUrl,partnerLogo,partnerLogoImage,rankForTopCompanies,salesNavigatorCompanyUrl,
-                school,showcase,staffCount,staffCountRange,staffingCompany,topCompaniesListName,universalName,url,
-                companyIndustries*,industries,specialities,
-                acquirerCompany~(entityUrn,logo,name,industries,followingInfo,url,paidCompany,universalName),
-                affiliatedCompanies*~(entityUrn,logo,name,industries,followingInfo,url,paidCompany,universalName),
-                groups*~(entityUrn,largeLogo,groupName,memberCount,websiteUrl,url),
-                showcasePages*~(entityUrn,logo,name,industries,followingInfo,url,description,universalName)
-                )
-                """
-            ),
-            "q": "universalName",
-            "universalName": public_id
-        }
+        self.client.bucket.acquire()  # pace requests instead of a blind random sleep
+        params = {**_SCHOOL_PARAMS_BASE, "universalName": public_id}
 
         res = self.client.session.get(
-            f"{self.client.API_BASE_URL}/organization/companies",
+            self._url_organizations,
             params=params
         )
 
-        data = res.json()
+        data = _loads(res.content)
 
         if data and "status" in data and data["status"] != 200:
             self.logger.info("request failed: {}".format(data["message"]))
@@ -415,6 +661,7 @@ class Linkedin(object):
 
         return school
 
+    @_ttl_cached(300)
     def get_company(self, public_id):
         """
         Return data for a single company.
@@ -422,35 +669,15 @@ class Linkedin(object):
         Args:
             public_id: public identifier i.e. univeristy-of-queensland
         """
-        sleep(random.randint(2, 5))  # sleep a random duration to try and evade suspention
-        params = {
-            "decoration": (
-                """
-                (
-                affiliatedCompaniesWithEmployeesRollup,affiliatedCompaniesWithJobsRollup,articlePermalinkForTopCompanies,
-                autoGenerated,backgroundCoverImage,companyEmployeesSearchPageUrl,
-                companyPageUrl,confirmedLocations*,coverPhoto,dataVersion,description,entityUrn,followingInfo,
-                foundedOn,headquarter,jobSearchPageUrl,lcpTreatment,logo,name,type,overviewPhoto,paidCompany,
-                partnerCompanyUrl,partnerLogo,partnerLogoImage,permissions,rankForTopCompanies,
-                salesNavigatorCompanyUrl,school,showcase,staffCount,staffCountRange,staffingCompany,
-                topCompaniesListName,universalName,url,companyIndustries*,industries,specialities,
-                acquirerCompany~(entityUrn,logo,name,industries,followingInfo,url,paidCompany,universalName),
-                affiliatedCompanies*~(entityUrn,logo,name,industries,followingInfo,url,paidCompany,universalName),
-                groups*~(entityUrn,largeLogo,groupName,memberCount,websiteUrl,url),
-                showcasePages*~(entityUrn,logo,name,industries,followingInfo,url,description,universalName)
-                )
-                """
-            ),
-            "q": "universalName",
-            "universalName": public_id
-        }
+        self.client.bucket.acquire()  # pace requests instead of a blind random sleep
+        params = {**_COMPANY_PARAMS_BASE, "universalName": public_id}
 
         res = self.client.session.get(
-            f"{self.client.API_BASE_URL}/organization/companies",
+            self._url_organizations,
             params=params
         )
 
-        data = res.json()
+        data = _loads(res.content)
 
         if data and "status" in data and data["status"] != 200:
             self.logger.info("request failed: {}".format(data["message"]))